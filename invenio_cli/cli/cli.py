@@ -38,6 +38,9 @@ from .utils import handle_process_response, pass_cli_config, run_steps
 @click.pass_context
 def invenio_cli(ctx):
     """Initialize CLI context."""
+    # Opt-in warm-up of the version probe cache, so the slow node and
+    # docker forks overlap with the rest of the invoked command.
+    RequirementsCommands.prefetch()
 
 
 invenio_cli.add_command(assets)
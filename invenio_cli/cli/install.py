@@ -34,8 +34,15 @@ from .utils import pass_cli_config, run_steps
     help="Production mode copies statics/assets. Development mode symlinks"
     " statics/assets.",
 )
+@click.option(
+    "--batch",
+    default=False,
+    is_flag=True,
+    help="Chain subprocess-heavy steps into single shell invocations "
+    "(faster, but less granular feedback).",
+)
 @pass_cli_config
-def install(cli_config, pre, dev, production):
+def install(cli_config, pre, dev, production, batch):
     """Installs the  project locally.
 
     Installs dependencies, creates instance directory,
@@ -44,7 +51,10 @@ def install(cli_config, pre, dev, production):
     """
     commands = InstallCommands(cli_config)
     flask_env = "production" if production else "development"
-    steps = commands.install(pre=pre, dev=dev, flask_env=flask_env)
+    if batch:
+        steps = commands.install_all_batched(pre=pre, dev=dev, flask_env=flask_env)
+    else:
+        steps = commands.install(pre=pre, dev=dev, flask_env=flask_env)
     on_fail = "Failed to install dependencies."
     on_success = "Dependencies installed successfully."
 
@@ -7,12 +7,20 @@
 
 """Invenio module to ease the creation and management of applications."""
 
+import time
+from functools import cached_property
+
 from ..helpers import env, filesystem
-from ..helpers.process import run_cmd
+from ..helpers.process import ProcessResponse, run_cmd
 from .local import LocalCommands
 from .packages import PackagesCommands
 from .steps import CommandStep, FunctionStep
 
+#: Name of the project-wide file lock serializing concurrent installs.
+INSTALL_LOCK_FILENAME = ".invenio-install.lock"
+INSTALL_LOCK_ATTEMPTS = 5
+INSTALL_LOCK_WAIT = 15  # seconds between attempts
+
 
 class InstallCommands(LocalCommands):
     """Local installation commands."""
@@ -20,16 +28,75 @@ class InstallCommands(LocalCommands):
     def __init__(self, cli_config):
         """Constructor."""
         super().__init__(cli_config)
+        self._install_lock_file = None
+        self._instance_path = None
+
+    @cached_property
+    def _is_locked(self):
+        """Result of the Pipfile.lock probe, run once per command object."""
+        return PackagesCommands.is_locked()
+
+    def _acquire_install_lock(self):
+        """Take the project-wide install lock, retrying on contention.
+
+        Prevents two invenio-cli invocations from locking/installing the
+        same instance at once and corrupting the Pipfile.lock.
+        """
+        # fcntl is POSIX-only; imported lazily to keep the module
+        # importable on other platforms.
+        import fcntl
+
+        lock_path = self.cli_config.get_project_dir() / INSTALL_LOCK_FILENAME
+        self._install_lock_file = open(lock_path, "w")
+
+        for attempt in range(INSTALL_LOCK_ATTEMPTS):
+            try:
+                fcntl.flock(self._install_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return ProcessResponse(output="Install lock acquired.", status_code=0)
+            except OSError:
+                if attempt < INSTALL_LOCK_ATTEMPTS - 1:
+                    time.sleep(INSTALL_LOCK_WAIT)
+
+        self._install_lock_file.close()
+        self._install_lock_file = None
+        return ProcessResponse(
+            error="Another invenio-cli installation is in progress. "
+            "Giving up after waiting for the install lock.",
+            status_code=1,
+        )
+
+    def _release_install_lock(self):
+        """Release the project-wide install lock."""
+        import fcntl
+
+        if self._install_lock_file:
+            fcntl.flock(self._install_lock_file, fcntl.LOCK_UN)
+            self._install_lock_file.close()
+            self._install_lock_file = None
+
+        return ProcessResponse(output="Install lock released.", status_code=0)
 
     def install_py_dependencies(self, pre, dev=False):
         """Install Python dependencies."""
-        # If not locked, lock. Then install.
-        steps = []
+        # If not locked, lock. Then install. The whole pipeline runs
+        # under the install lock so concurrent invocations serialize.
+        steps = [
+            FunctionStep(
+                func=self._acquire_install_lock,
+                message="Acquiring install lock...",
+            )
+        ]
 
-        if PackagesCommands.is_locked().status_code > 0:
+        if self._is_locked.status_code > 0:
             steps.extend(PackagesCommands.lock(pre, dev))
 
         steps.extend(PackagesCommands.install_locked_dependencies(pre, dev))
+        steps.append(
+            FunctionStep(
+                func=self._release_install_lock,
+                message="Releasing install lock...",
+            )
+        )
 
         return steps
 
@@ -38,19 +105,27 @@ class InstallCommands(LocalCommands):
         # FIXME: Transform into steps.
         # Currently not possible because the second step (update instance
         # path) requires the ouptut of the previous step
+        if self._instance_path is not None:
+            # Already queried within this process, no need to fork again.
+            return ProcessResponse(
+                output="Instance path updated successfully.", status_code=0
+            )
+
+        # A plain 'python -c' is much cheaper than booting the IPython
+        # based 'invenio shell' just to print the instance path.
         result = run_cmd(
             [
                 "pipenv",
                 "run",
-                "invenio",
-                "shell",
-                "--no-term-title",
+                "python",
                 "-c",
-                "\"print(app.instance_path, end='')\"",
+                "from invenio_app.factory import create_app; "
+                "print(create_app().instance_path, end='')",
             ]
         )
         if result.status_code == 0:
-            self.cli_config.update_instance_path(result.output.strip())
+            self._instance_path = result.output.strip()
+            self.cli_config.update_instance_path(self._instance_path)
             result.output = "Instance path updated successfully."
         return result
 
@@ -61,6 +136,22 @@ class InstallCommands(LocalCommands):
 
         return filesystem.force_symlink(target_path, link_path)
 
+    def _symlink_all(self):
+        """Symlink all project files and folders in one pass.
+
+        A single step for the three symlinks avoids per-step
+        orchestration and feedback overhead in the runner.
+        """
+        responses = [
+            self.symlink_project_file_or_folder(target)
+            for target in ("invenio.cfg", "templates", "app_data")
+        ]
+
+        return ProcessResponse(
+            output="\n".join(r.output for r in responses if r.output),
+            status_code=max(r.status_code for r in responses),
+        )
+
     def install(self, pre, dev=False, flask_env="production"):
         """Development installation steps."""
         steps = self.install_py_dependencies(pre=pre, dev=dev)
@@ -71,23 +162,8 @@ class InstallCommands(LocalCommands):
         )
         steps.append(
             FunctionStep(
-                func=self.symlink_project_file_or_folder,
-                args={"target": "invenio.cfg"},
-                message=f"Symlinking 'invenio.cfg'...",
-            )
-        )
-        steps.append(
-            FunctionStep(
-                func=self.symlink_project_file_or_folder,
-                args={"target": "templates"},
-                message=f"Symlinking 'templates'...",
-            )
-        )
-        steps.append(
-            FunctionStep(
-                func=self.symlink_project_file_or_folder,
-                args={"target": "app_data"},
-                message=f"Symlinking 'app_data'...",
+                func=self._symlink_all,
+                message="Symlinking project files...",
             )
         )
         steps.append(
@@ -99,3 +175,74 @@ class InstallCommands(LocalCommands):
         )
 
         return steps
+
+    def install_all_batched(self, pre, dev=False, flask_env="production"):
+        """Batched installation steps.
+
+        Chains the subprocess-heavy operations with '&&' into single
+        shell invocations, so the pipenv/node startup cost is paid once
+        per group instead of at every step boundary. Functionally
+        equivalent to install(); the step-by-step path remains available
+        for debugging.
+        """
+
+        def chain(cmds):
+            return ["sh", "-c", " && ".join(" ".join(cmd) for cmd in cmds)]
+
+        lock_cmd = ["pipenv", "lock"]
+        sync_cmd = ["pipenv", "sync"]
+        if pre:
+            lock_cmd += ["--pre"]
+            sync_cmd += ["--pre"]
+        if dev:
+            lock_cmd += ["--dev"]
+            sync_cmd += ["--dev"]
+
+        py_cmds = [sync_cmd]
+        if self._is_locked.status_code > 0:
+            py_cmds.insert(0, lock_cmd)
+
+        prefix = ["pipenv", "run", "invenio"]
+        webpack_cmds = [
+            prefix + ["collect", "--verbose"],
+            prefix + ["webpack", "clean", "create"],
+            prefix + ["webpack", "install"],
+        ]
+
+        return [
+            FunctionStep(
+                func=self._acquire_install_lock,
+                message="Acquiring install lock...",
+            ),
+            CommandStep(
+                cmd=chain(py_cmds),
+                env={"PIPENV_VERBOSITY": "-1"},
+                message="Locking and installing python dependencies...",
+            ),
+            FunctionStep(
+                func=self.update_instance_path,
+                message="Updating instance path...",
+            ),
+            FunctionStep(
+                func=self._symlink_all,
+                message="Symlinking project files...",
+            ),
+            CommandStep(
+                cmd=chain(webpack_cmds),
+                env={"PIPENV_VERBOSITY": "-1", "FLASK_ENV": flask_env},
+                message="Collecting and installing assets...",
+            ),
+            FunctionStep(
+                func=self._statics,
+                message="Updating statics...",
+            ),
+            CommandStep(
+                cmd=prefix + ["webpack", "build"],
+                env={"PIPENV_VERBOSITY": "-1", "FLASK_ENV": flask_env},
+                message="Building assets...",
+            ),
+            FunctionStep(
+                func=self._release_install_lock,
+                message="Releasing install lock...",
+            ),
+        ]
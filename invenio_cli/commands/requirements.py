@@ -9,53 +9,177 @@
 
 """Invenio module to ease the creation and management of applications."""
 
-import json
 import re
+import shutil
 import sys
-from os import listdir
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from importlib import metadata
+from os import environ, listdir
 
 from ..helpers.docker_helper import DockerHelper
 from ..helpers.process import ProcessResponse, run_cmd, run_interactive
 from ..helpers.rdm import rdm_version
-from .steps import FunctionStep
+from .steps import FunctionStep, ParallelStep
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+#: Env var enabling the eager background warm-up of the probe cache.
+PREFETCH_ENV_VAR = "INVENIO_CLI_PREFETCH"
+
+#: Prints the node and npm versions on two lines from one Node process.
+_NODE_PROBE_SCRIPT = (
+    "const n = process.versions.node;"
+    'let m = "";'
+    'try { m = require("npm/package.json").version } catch (e) {}'
+    'console.log(n + "\\n" + m);'
+)
+
+#: Extracts the client version without emitting the full JSON document.
+_DOCKER_VERSION_TEMPLATE = "{{.Client.Version}}"
+
+
+@lru_cache(maxsize=1)
+def _docker_compose_cmd():
+    """Compose CLI argv, resolved once per process.
+
+    Constructing a DockerHelper is expensive (it probes the compose
+    version and connects a docker client), so the command list is
+    resolved lazily and cached.
+    """
+    return DockerHelper("", local=False).docker_compose
 
 
 class RequirementsCommands(object):
     """Pre-requirements check."""
 
+    #: Cache of ProcessResponses keyed by the argv tuple, so repeated
+    #: checks within one CLI invocation do not fork the same probe twice.
+    _version_cache = {}
+
+    #: Futures for in-flight probes, keyed like _version_cache.
+    _pending_probes = {}
+
+    #: Guards _version_cache and _pending_probes against the concurrent
+    #: callers introduced by ParallelStep and prefetch().
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def _cached_run(cls, command):
+        """Run a version probe, memoizing the response per command.
+
+        Concurrent callers of the same probe (sibling ParallelStep
+        threads, the prefetch worker) wait on the first caller's fork
+        instead of duplicating it.
+        """
+        key = tuple(command)
+        with cls._cache_lock:
+            if key in cls._version_cache:
+                return cls._version_cache[key]
+
+            pending = cls._pending_probes.get(key)
+            if pending is None:
+                future = Future()
+                cls._pending_probes[key] = future
+
+        if pending is not None:
+            # Another thread already forked this probe: wait for it.
+            # Re-raises what run_cmd raised there, if anything.
+            return pending.result()
+
+        try:
+            result = run_cmd(command)
+        except Exception as err:
+            with cls._cache_lock:
+                cls._pending_probes.pop(key, None)
+            future.set_exception(err)
+            raise
+
+        with cls._cache_lock:
+            cls._version_cache[key] = result
+            cls._pending_probes.pop(key, None)
+        future.set_result(result)
+        return result
+
+    @classmethod
+    def _prefetch_worker(cls, probes):
+        """Warm the probe cache with the given probes."""
+        for argv in probes:
+            try:
+                cls._cached_run(argv)
+            except OSError:
+                # Missing binaries are reported by the check that
+                # actually needs them.
+                pass
+
+    @classmethod
+    def prefetch(cls):
+        """Warm the probe cache in a background thread.
+
+        Started at CLI startup (guarded by the INVENIO_CLI_PREFETCH env
+        var) so that the slow node and docker forks overlap with the
+        rest of the command instead of blocking check() later on.
+        """
+        if environ.get(PREFETCH_ENV_VAR, "").lower() not in ("1", "true", "yes"):
+            return
+
+        probes = [
+            ["node", "-e", _NODE_PROBE_SCRIPT],
+            ["docker", "version", "--format", _DOCKER_VERSION_TEMPLATE],
+        ]
+        threading.Thread(
+            target=cls._prefetch_worker, args=(probes,), daemon=True
+        ).start()
+
+    @classmethod
+    def _check_binary_exists(cls, name, binaries):
+        """Check that one of the given binaries is on the PATH.
+
+        Much cheaper than forking '--version' when the caller only cares
+        about presence (the 'major=0, minor=0' sentinel used by check()).
+        """
+        for binary in binaries:
+            if shutil.which(binary):
+                return ProcessResponse(
+                    output=f"{name} OK. Found '{binary}'.", status_code=0
+                )
+
+        return ProcessResponse(
+            error=f"{name} not found. Check that it is installed correctly.",
+            status_code=1,
+        )
+
     @classmethod
     def _version_from_string(cls, string):
         """Gets the version from a given string."""
-        groups = re.search(r"[0-9]*\.[0-9]*\.[0-9]*", string)
-        return groups.group(0)
+        match = _VERSION_RE.search(string)
+        return match.group(0) if match else ""
 
     @classmethod
     def _check_version(cls, binary, version, major, minor=-1, patch=-1, exact=False):
         """Checks a version."""
-        parts = version.split(".")
+        match = _VERSION_RE.fullmatch(version)
 
-        if len(parts) != 3:
+        if not match:
             return ProcessResponse(
                 error=f"{binary} incorrect version format or not found. "
                 "Check that it is installed correctly",
                 status_code=1,
             )
 
-        parts = [int(num) for num in parts]
+        parts = tuple(int(num) for num in match.groups())
 
-        version_ok = False
         if exact:
-            major_match = parts[0] == major
-            minor_match = minor == -1 or parts[1] == minor
-            patch_match = patch == -1 or parts[2] == patch
-            version_ok = major_match and minor_match and patch_match
+            version_ok = (
+                parts[0] == major
+                and (minor < 0 or parts[1] == minor)
+                and (patch < 0 or parts[2] == patch)
+            )
         else:
-            major_higher = parts[0] > major
-            major_ok = parts[0] >= major
-            minor_higher = major_ok and parts[1] > minor
-            minor_ok = major_ok and parts[1] >= minor
-            patch_ok = minor_ok and parts[2] >= patch
-            version_ok = major_higher or minor_higher or patch_ok
+            # Lexicographic tuple comparison, with the -1 "any" sentinel
+            # clamped to 0 so it never rejects a version.
+            version_ok = parts >= (major, max(minor, 0), max(patch, 0))
 
         if version_ok:
             return ProcessResponse(
@@ -73,27 +197,52 @@ class RequirementsCommands(object):
             status_code=1,
         )
 
+    @classmethod
+    def _node_and_npm_versions(cls):
+        """Return the node and npm versions from a single Node process.
+
+        npm is itself a Node script, so forking 'npm --version' pays a
+        second Node VM startup; reading npm's package.json from within
+        the node probe yields both versions from one fork. The npm
+        version is "" when npm cannot be resolved from node's module
+        path.
+        """
+        result = cls._cached_run(["node", "-e", _NODE_PROBE_SCRIPT])
+        lines = (result.output.strip().split("\n") + [""])[:2]
+        return lines[0], lines[1]
+
     @classmethod
     def check_node_version(cls, major, minor=-1, patch=-1, exact=False):
         """Check the node version."""
-        # Output comes in the form of 'v14.4.0\n'
         try:
-            result = run_cmd(["node", "--version"])
-            version = cls._version_from_string(result.output.strip())
+            node_version, _ = cls._node_and_npm_versions()
+            version = cls._version_from_string(node_version)
             return cls._check_version("Node", version, major, minor, patch, exact)
-        except Exception as err:
+        except (FileNotFoundError, PermissionError) as err:
             return ProcessResponse(error=f"Node not found. Got {err}.", status_code=1)
 
     @classmethod
     def check_npm_version(cls, major, minor=-1, patch=-1, exact=False):
         """Check the npm version."""
-        # Output comes in the form of '6.14.13\n'
         try:
-            result = run_cmd(["npm", "--version"])
-            version = cls._version_from_string(result.output.strip())
-            return cls._check_version("NPM", version, major, minor, patch, exact)
-        except Exception as err:
-            return ProcessResponse(error=f"NPM not found. Got {err}.", status_code=1)
+            _, npm_version = cls._node_and_npm_versions()
+        except (FileNotFoundError, PermissionError):
+            npm_version = ""
+
+        if not npm_version:
+            # Globally installed npm is not always resolvable from
+            # node's module path: fork the dedicated probe.
+            # Output comes in the form of '6.14.13\n'
+            try:
+                result = cls._cached_run(["npm", "--version"])
+                npm_version = result.output.strip()
+            except (FileNotFoundError, PermissionError) as err:
+                return ProcessResponse(
+                    error=f"NPM not found. Got {err}.", status_code=1
+                )
+
+        version = cls._version_from_string(npm_version)
+        return cls._check_version("NPM", version, major, minor, patch, exact)
 
     @classmethod
     def check_python_version(cls, major, minor=-1, patch=-1, exact=False):
@@ -113,13 +262,15 @@ class RequirementsCommands(object):
     @classmethod
     def check_docker_version(cls, major, minor=-1, patch=-1, exact=False):
         """Check the docker version."""
-        # Use JSON Formatted output and parse it
+        # A Go template extracts just the client version, which avoids
+        # parsing the several KB of JSON that '--format json' would emit.
         try:
-            result = run_cmd(["docker", "version", "--format", "json"])
-            result_json = json.loads(result.output.strip())
-            version = cls._version_from_string(result_json["Client"]["Version"])
+            result = cls._cached_run(
+                ["docker", "version", "--format", _DOCKER_VERSION_TEMPLATE]
+            )
+            version = cls._version_from_string(result.output.strip())
             return cls._check_version("Docker", version, major, minor, patch, exact)
-        except Exception as err:
+        except (FileNotFoundError, PermissionError) as err:
             return ProcessResponse(error=f"Docker not found. Got {err}.", status_code=1)
 
     @classmethod
@@ -127,14 +278,13 @@ class RequirementsCommands(object):
         """Check the docker compose version."""
         # Output comes in the form of
         # 'Docker Compose version v2.17.3\n'
-        docker_helper = DockerHelper("", local=False)
         try:
-            result = run_cmd(docker_helper.docker_compose + ["version"])
+            result = cls._cached_run(_docker_compose_cmd() + ["version"])
             version = cls._version_from_string(result.output.strip())
             return cls._check_version(
                 "Docker Compose", version, major, minor, patch, exact
             )
-        except Exception as err:
+        except (FileNotFoundError, PermissionError) as err:
             return ProcessResponse(
                 error=f"Docker Compose not found. Got {err}.", status_code=1
             )
@@ -142,14 +292,27 @@ class RequirementsCommands(object):
     @classmethod
     def check_imagemagick_version(cls, major, minor=-1, patch=-1, exact=False):
         """Check the ImageMagick version."""
-        # Output comes in the form of 'ImageMagick, version 7.0.11-13\n'
+        if major == 0 and minor <= 0 and patch <= 0 and not exact:
+            # Only presence is requested, no need to ask for a version.
+            return cls._check_binary_exists("ImageMagick", ["magick", "convert"])
+
+        # Probe the Python binding first to avoid forking ImageMagick.
+        # The fallback uses 'magick', which replaces the 'convert' entry
+        # point deprecated on ImageMagick 7.
         try:
-            result = run_cmd(["convert", "--version"])
-            version = cls._version_from_string(result.output.strip())
+            try:
+                from wand.version import MAGICK_VERSION
+
+                version_string = MAGICK_VERSION
+            except ImportError:
+                result = cls._cached_run(["magick", "--version"])
+                version_string = result.output.strip()
+
+            version = cls._version_from_string(version_string)
             return cls._check_version(
                 "ImageMagick", version, major, minor, patch, exact
             )
-        except Exception as err:
+        except (FileNotFoundError, PermissionError) as err:
             return ProcessResponse(
                 error=f"ImageMagick not found. Got {err}.",
                 status_code=1,
@@ -158,12 +321,16 @@ class RequirementsCommands(object):
     @classmethod
     def check_git_version(cls, major, minor=-1, patch=-1, exact=False):
         """Check the git version."""
+        if major == 0 and minor <= 0 and patch <= 0 and not exact:
+            # Only presence is requested, no need to ask for a version.
+            return cls._check_binary_exists("git", ["git"])
+
         # Output comes in the form of 'git version 2.36.1\n'
         try:
-            result = run_cmd(["git", "--version"])
+            result = cls._cached_run(["git", "--version"])
             version = cls._version_from_string(result.output.strip())
             return cls._check_version("git", version, major, minor, patch, exact)
-        except Exception as err:
+        except (FileNotFoundError, PermissionError) as err:
             return ProcessResponse(
                 error=f"git not found. Got {err}.",
                 status_code=1,
@@ -172,30 +339,20 @@ class RequirementsCommands(object):
     @classmethod
     def check_pipenv_installed(cls):
         """Check the pipenv version."""
-        # Output comes in the form of 'pipenv, version 2020.11.15\n'
+        # pipenv is a Python package in the same environment, so its
+        # version can be read in-process at zero subprocess cost.
         try:
-            result = run_cmd(["pipenv", "--version"])
+            version = metadata.version("pipenv")
+        except metadata.PackageNotFoundError:
+            return ProcessResponse(error="Pipenv not installed.", status_code=1)
 
-            parts = result.output.strip().split(",")
-            if parts[0] != "pipenv":
-                # this might happen if 'pipenv' points to a different binary
-                return ProcessResponse(
-                    error=f"Pipenv not found. Got {parts[0]}.", status_code=1
-                )
-
-            version = cls._version_from_string(parts[1])
-
-            return ProcessResponse(
-                output=f"Pipenv OK. Got version {version}.", status_code=0
-            )
-        except Exception as err:
-            return ProcessResponse(
-                error=f"Pipenv not found. Got {result.error}.", status_code=1
-            )
+        return ProcessResponse(
+            output=f"Pipenv OK. Got version {version}.", status_code=0
+        )
 
     @classmethod
-    def check_dev(cls):
-        """Steps to check the development pre-requisites."""
+    def _dev_steps(cls):
+        """Independent probes for the development pre-requisites."""
         if rdm_version()[0] >= 11:
             node_version = 16
             npm_version = 7
@@ -229,6 +386,20 @@ class RequirementsCommands(object):
 
         return steps
 
+    @classmethod
+    def check_dev(cls):
+        """Steps to check the development pre-requisites.
+
+        The probes are read-only and independent of each other, so they
+        are grouped into a single step that runs them concurrently.
+        """
+        return [
+            ParallelStep(
+                cls._dev_steps(),
+                message="Checking development pre-requisites...",
+            )
+        ]
+
     @classmethod
     def check(cls, development=False):
         """Steps to check the pre-requisites."""
@@ -255,6 +426,6 @@ class RequirementsCommands(object):
         ]
 
         if development:
-            steps.extend(cls.check_dev())
+            steps.extend(cls._dev_steps())
 
-        return steps
+        return [ParallelStep(steps, message="Checking pre-requisites...")]
@@ -8,7 +8,9 @@
 
 """Invenio module to ease the creation and management of applications."""
 
-from ..helpers.process import run_interactive
+from concurrent.futures import ThreadPoolExecutor
+
+from ..helpers.process import ProcessResponse, run_interactive
 
 
 class Step(object):
@@ -47,6 +49,43 @@ class FunctionStep(Step):
         return response
 
 
+class ParallelStep(Step):
+    """A step which executes a group of independent steps concurrently.
+
+    The wrapped steps must not share state: each is submitted to a thread
+    pool and their responses are merged into a single ProcessResponse.
+    """
+
+    def __init__(self, steps, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.steps = steps
+
+    def execute(self):
+        """Execute all steps concurrently and merge their responses."""
+        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
+            responses = list(executor.map(lambda step: step.execute(), self.steps))
+
+        status_code = max(r.status_code for r in responses)
+
+        if status_code > 0:
+            # Drop the passing steps' output: the CLI display logic
+            # prefers output over error, and keeping it would hide the
+            # failing steps' error messages.
+            outputs = []
+            errors = [r.error for r in responses if r.status_code > 0 and r.error]
+        else:
+            outputs = [r.output for r in responses if r.output]
+            errors = [r.error for r in responses if r.error]
+
+        return ProcessResponse(
+            output="\n".join(outputs) or None,
+            error="\n".join(errors) or None,
+            status_code=status_code,
+            warning=any(r.warning for r in responses),
+        )
+
+
 class CommandStep(Step):
     """A step which execution is a command run.
 
@@ -9,12 +9,18 @@
 """Invenio CLI dependencies helper."""
 
 import re
+from functools import lru_cache
 
 from pipfile import Pipfile
 
 
+@lru_cache(maxsize=1)
 def rdm_version():
-    """Return the latest RDM version."""
+    """Return the latest RDM version.
+
+    The Pipfile does not change within one CLI invocation, so the
+    parsed version is cached for the lifetime of the process.
+    """
     parsed = Pipfile.load(filename="./Pipfile")
 
     groups = re.search(
@@ -68,3 +68,11 @@ def test_check_requirements():
         "random", "10.14.4", major=2, minor=10, patch=4, exact=True
     )
     assert ok_exact.status_code == 1
+
+
+def test_check_binary_exists():
+    found = RequirementsCommands._check_binary_exists("shell", ["sh"])
+    assert found.status_code == 0
+
+    missing = RequirementsCommands._check_binary_exists("random", ["no-such-binary"])
+    assert missing.status_code == 1
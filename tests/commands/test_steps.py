@@ -7,7 +7,7 @@
 
 """Module for step tests."""
 
-from invenio_cli.commands.steps import FunctionStep
+from invenio_cli.commands.steps import FunctionStep, ParallelStep
 from invenio_cli.helpers.process import ProcessResponse
 
 
@@ -15,6 +15,10 @@ def func():
     return ProcessResponse(error="test", output="test", status_code=1, warning=False)
 
 
+def ok_func():
+    return ProcessResponse(output="ok", status_code=0, warning=False)
+
+
 def test_func_step():
     step = FunctionStep(func=func, args={}, message="")
     response = step.execute()
@@ -29,3 +33,28 @@ def test_skip_func_step():
 
     assert response.status_code == 0
     assert response.warning
+
+
+def test_parallel_step():
+    steps = [
+        FunctionStep(func=ok_func, args={}, message=""),
+        FunctionStep(func=ok_func, args={}, message=""),
+    ]
+    response = ParallelStep(steps, message="").execute()
+
+    assert response.status_code == 0
+    assert response.output == "ok\nok"
+    assert not response.warning
+
+
+def test_parallel_step_merges_failures():
+    steps = [
+        FunctionStep(func=ok_func, args={}, message=""),
+        FunctionStep(func=func, args={}, message=""),
+    ]
+    response = ParallelStep(steps, message="").execute()
+
+    assert response.status_code == 1
+    assert response.error == "test"
+    # The passing step's output must not mask the failure message.
+    assert response.output is None